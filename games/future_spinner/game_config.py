@@ -43,6 +43,8 @@
 #   control of the trigger rate through the freegame fence hit-rate.
 
 import os
+import sys
+import numpy as np
 from src.config.config import Config
 from src.config.distributions import Distribution
 from src.config.betmode import BetMode
@@ -51,6 +53,62 @@ from src.config.betmode import BetMode
 _BASE_RTP = 0.9635   # Shared RTP target across both bet modes
 _WINCAP = 5000.0     # Maximum payout multiplier (x bet amount), hard cap both modes
 
+# Fixed symbol id order (paying tiers high to low, then Wild and Scatter). The
+# ids index every integer-coded table on GameConfig, so the order must never
+# change without regenerating anything built from those tables.
+_SYMBOLS = ("H1", "H2", "M1", "M2", "M3", "L1", "L2", "L3", "W", "S")
+
+# -- Static tables -------------------------------------------------------------
+# Pure constants, built once at import and bound by reference in __init__.
+# Plain dicts rather than MappingProxyType: where sim workers are spawned
+# rather than forked (macOS, Windows) the config is pickled, and a
+# mappingproxy cannot be pickled. Treat them as read-only.
+
+# Paytable (UNCHANGED from the validated base package)
+# Format: {(match_count, symbol_id): payout_per_way}. Final ways win =
+# paytable_value x ways_count x bet, then x the Overdrive multiplier during
+# free spins. Wild (W) is a pure substitute (no paytable entry); Scatter (S)
+# pays via _SCATTER_MULTIPLIER_TABLE.
+_PAYTABLE = {
+    (5, "H1"): 22.0, (4, "H1"): 6.0, (3, "H1"): 1.5,
+    (5, "H2"): 10.0, (4, "H2"): 3.0, (3, "H2"): 0.8,
+    (5, "M1"): 5.0,  (4, "M1"): 1.5, (3, "M1"): 0.45,
+    (5, "M2"): 4.0,  (4, "M2"): 1.0, (3, "M2"): 0.3,
+    (5, "M3"): 2.0,  (4, "M3"): 0.6, (3, "M3"): 0.2,
+    (5, "L1"): 1.5,  (4, "L1"): 0.45, (3, "L1"): 0.15,
+    (5, "L2"): 0.8,  (4, "L2"): 0.25, (3, "L2"): 0.10,
+    (5, "L3"): 0.65, (4, "L3"): 0.20, (3, "L3"): 0.08,
+}
+
+# No symbol-multiplier wilds: the Overdrive multiplier is a game-level (global)
+# multiplier applied via the "global" ways strategy.
+_SPECIAL_SYMBOLS = {
+    "wild": ["W"],
+    "scatter": ["S"],
+    "multiplier": [],
+}
+
+# Instant scatter pays (UNCHANGED), multiples of TOTAL BET.
+_SCATTER_MULTIPLIER_TABLE = {
+    3: 1.0,   # 3 scatters -> 1x total bet
+    4: 3.0,   # 4 scatters -> 3x total bet
+    5: 10.0,  # 5 scatters -> 10x total bet
+}
+
+# Base-game free spins awarded per scatter count (6+ pays the 5-scatter
+# amount), and the flat free-game retrigger award.
+_BASE_FS_AWARD = {3: 8, 4: 12, 5: 16}
+_RETRIGGER_FS_AWARD = 5
+
+_BET_LEVELS = [0.10, 0.20, 0.50, 1.00, 2.00, 5.00, 10.00, 20.00, 50.00, 100.00]
+
+_REEL_FILES = {
+    "BR0": "BR0.csv",
+    "FR0": "FR0.csv",
+    "BRWCAP": "BRWCAP.csv",
+    "FRWCAP": "FRWCAP.csv",
+}
+
 
 class GameConfig(Config):
     """
@@ -84,9 +142,15 @@ class GameConfig(Config):
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
         return cls._instance
 
     def __init__(self):
+        # __new__ hands back the cached instance, but Python still calls
+        # __init__ on every GameConfig(). Build once per process: repeat calls
+        # must not re-read the reel CSVs or rebuild the bet modes.
+        if getattr(self, "_initialized", False):
+            return
         super().__init__()
 
         # -- Identity ----------------------------------------------------------
@@ -103,7 +167,7 @@ class GameConfig(Config):
 
         # -- Denomination ------------------------------------------------------
         self.min_denomination = 0.10
-        self.bet_levels = [0.10, 0.20, 0.50, 1.00, 2.00, 5.00, 10.00, 20.00, 50.00, 100.00]
+        self.bet_levels = _BET_LEVELS
 
         self.construct_paths()
 
@@ -111,39 +175,60 @@ class GameConfig(Config):
         self.num_reels = 5
         self.num_rows = [4] * self.num_reels
 
-        # -- Paytable (UNCHANGED from the validated base package) --------------
-        # Format: {(match_count, symbol_id): payout_per_way}. Final ways win =
-        # paytable_value x ways_count x bet, then x the Overdrive multiplier
-        # during free spins. Wild (W) is a pure substitute (no paytable entry);
-        # Scatter (S) pays via scatter_multiplier_table.
-        self.paytable = {
-            (5, "H1"): 22.0, (4, "H1"): 6.0, (3, "H1"): 1.5,
-            (5, "H2"): 10.0, (4, "H2"): 3.0, (3, "H2"): 0.8,
-            (5, "M1"): 5.0,  (4, "M1"): 1.5, (3, "M1"): 0.45,
-            (5, "M2"): 4.0,  (4, "M2"): 1.0, (3, "M2"): 0.3,
-            (5, "M3"): 2.0,  (4, "M3"): 0.6, (3, "M3"): 0.2,
-            (5, "L1"): 1.5,  (4, "L1"): 0.45, (3, "L1"): 0.15,
-            (5, "L2"): 0.8,  (4, "L2"): 0.25, (3, "L2"): 0.10,
-            (5, "L3"): 0.65, (4, "L3"): 0.20, (3, "L3"): 0.08,
-        }
+        # -- Integer symbol ids -----------------------------------------------
+        # symbol_to_id / id_to_symbol map the 10 symbols onto small ints for the
+        # vectorised reel and paytable tables below. The SDK itself still works
+        # on symbol names.
+        self.id_to_symbol = _SYMBOLS
+        self.symbol_to_id = {sym: idx for idx, sym in enumerate(_SYMBOLS)}
+
+        # -- Paytable (UNCHANGED, see _PAYTABLE) --------------------------------
+        self.paytable = _PAYTABLE
+
+        # Dense view of the same paytable: paytable_arr[symbol_id, match_count]
+        # is the per-way pay, 0.0 where there is no entry (W, S, counts < 3).
+        # float64 so every entry equals its dict value exactly. The dict stays
+        # the source of truth for the SDK.
+        self.paytable_arr = np.zeros((len(_SYMBOLS), self.num_reels + 1), dtype=np.float64)
+        for (kind, sym), pay in self.paytable.items():
+            self.paytable_arr[self.symbol_to_id[sym], kind] = pay
+
+        # Fixed-point copy in hundredths of a bet (every pay has at most two
+        # decimals): paytable_int = paytable_arr * pay_scale, exactly. Lets a
+        # batch evaluator accumulate wins in integers and divide once.
+        self.pay_scale = 100
+        self.paytable_int = np.rint(self.paytable_arr * self.pay_scale).astype(np.int32)
 
         # -- Special symbols ---------------------------------------------------
-        # No symbol-multiplier wilds: the Overdrive multiplier is a game-level
-        # (global) multiplier applied via the "global" ways strategy.
-        self.special_symbols = {
-            "wild": ["W"],
-            "scatter": ["S"],
-            "multiplier": [],
-        }
+        self.special_symbols = _SPECIAL_SYMBOLS
+        self.wild_ids = np.array(
+            [self.symbol_to_id[sym] for sym in self.special_symbols["wild"]], dtype=np.int8
+        )
+        self.scatter_ids = np.array(
+            [self.symbol_to_id[sym] for sym in self.special_symbols["scatter"]], dtype=np.int8
+        )
+        self.wild_id = self.symbol_to_id["W"]
+        self.scatter_id = self.symbol_to_id["S"]
 
         # -- Scatter multiplier table (instant pays, UNCHANGED) ----------------
         # Awards are multiples of TOTAL BET, paid on the spin the scatters land.
         # During free spins these are multiplied by the current Overdrive meter.
-        self.scatter_multiplier_table = {
-            3: 1.0,   # 3 scatters -> 1x total bet
-            4: 3.0,   # 4 scatters -> 3x total bet
-            5: 10.0,  # 5 scatters -> 10x total bet
-        }
+        self.scatter_multiplier_table = _SCATTER_MULTIPLIER_TABLE
+
+        # Same pays indexed directly by scatter count: scatter_mult_arr[n] is the
+        # award for n scatters, 0.0 below 3. Sized to the 20-cell maximum since
+        # free-spin scatters can stack; 6+ pays the top (5-scatter) award. The
+        # dict stays for config dumps and the frontend.
+        _MAX_SCATTERS = self.num_reels * max(self.num_rows)  # 5 x 4 = 20
+        _top = max(self.scatter_multiplier_table)
+        self.scatter_mult_arr = np.zeros(_MAX_SCATTERS + 1, dtype=np.float64)
+        for count, mult in self.scatter_multiplier_table.items():
+            self.scatter_mult_arr[count] = mult
+        self.scatter_mult_arr[_top + 1:] = self.scatter_multiplier_table[_top]
+        self.scatter_mult_int = np.rint(self.scatter_mult_arr * self.pay_scale).astype(np.int32)
+        # Tuple of Python floats for the per-spin scalar lookup: indexing a
+        # tuple is cheaper than a numpy scalar read plus float().
+        self.scatter_mult_lut = tuple(float(mult) for mult in self.scatter_mult_arr)
 
         # -- Free-spin triggers ------------------------------------------------
         # basegame: 3/4/5 scatters award 8/12/16 free spins. The base trigger is
@@ -153,13 +238,11 @@ class GameConfig(Config):
         # amount). freegame retrigger is a flat +5 for any 3+ scatters.
         # The minimum key (3) is also the resample threshold used by draw_board()
         # for non-forced base criteria, preventing accidental triggers there.
-        _MAX_SCATTERS = self.num_reels * max(self.num_rows)  # 5 x 4 = 20
-        _base_award = {3: 8, 4: 12, 5: 16}
         self.freespin_triggers = {
             self.basegame_type: {
-                n: _base_award.get(n, 16) for n in range(3, _MAX_SCATTERS + 1)
+                n: _BASE_FS_AWARD.get(n, _BASE_FS_AWARD[5]) for n in range(3, _MAX_SCATTERS + 1)
             },
-            self.freegame_type: {n: 5 for n in range(3, _MAX_SCATTERS + 1)},
+            self.freegame_type: {n: _RETRIGGER_FS_AWARD for n in range(3, _MAX_SCATTERS + 1)},
         }
 
         # anticipation on the final reel when a trigger is one scatter away.
@@ -178,17 +261,26 @@ class GameConfig(Config):
         # BRWCAP : H1/Wild heavy wincap strip (base trigger draw).
         # FRWCAP : H1/Wild heavy wincap strip used inside free spins so a forced
         #          wincap round can reach exactly 5,000x with the Overdrive meter.
-        _reel_files = {
-            "BR0": "BR0.csv",
-            "FR0": "FR0.csv",
-            "BRWCAP": "BRWCAP.csv",
-            "FRWCAP": "FRWCAP.csv",
-        }
+        # self.reels keeps the SDK's list-of-strings strips (draw_board and
+        # make_fe_config read symbol names). self.reel_ids holds the same strips
+        # as contiguous int8 arrays of shape (num_reels, strip_len), indexed
+        # [reel][stop] exactly like self.reels, for vectorised consumers.
         self.reels = {}
-        for reel_id, filename in _reel_files.items():
-            reel_path = os.path.join(self.reels_path, filename)
-            if os.path.exists(reel_path):
-                self.reels[reel_id] = self.read_reels_csv(reel_path)
+        self.reel_ids = {}
+        self.reel_len = {}
+        self.reel_symbol_counts = {}
+        # One directory listing instead of a stat per configured strip.
+        present = (
+            {entry.name for entry in os.scandir(self.reels_path)}
+            if os.path.isdir(self.reels_path) else set()
+        )
+        for reel_id, filename in _REEL_FILES.items():
+            if filename in present:
+                reel_path = os.path.join(self.reels_path, filename)
+                self.reels[reel_id] = self._read_reels_interned(reel_path)
+                self.reel_ids[reel_id] = self.strip_to_ids(self.reels[reel_id])
+                self.reel_len[reel_id] = self.reel_ids[reel_id].shape[1]
+                self.reel_symbol_counts[reel_id] = self.strip_symbol_counts(self.reel_ids[reel_id])
 
         # -- Padding reels (required by make_fe_config) ------------------------
         self.padding_reels = {}
@@ -275,7 +367,9 @@ class GameConfig(Config):
             "scatter_triggers": {3: 50, 4: 30, 5: 20},
         }
 
+        # max_win is the int cap; win_criteria wants the same value as a float.
         _maxwin = int(_WINCAP)
+        _maxwin_f = float(_maxwin)
 
         # -- Bet modes ---------------------------------------------------------
         self.bet_modes = [
@@ -292,7 +386,7 @@ class GameConfig(Config):
                     Distribution(
                         criteria="wincap",
                         quota=0.002,
-                        win_criteria=float(_maxwin),
+                        win_criteria=_maxwin_f,
                         conditions=wincap_condition,
                     ),
                     Distribution(
@@ -326,7 +420,7 @@ class GameConfig(Config):
                     Distribution(
                         criteria="wincap",
                         quota=0.004,
-                        win_criteria=float(_maxwin),
+                        win_criteria=_maxwin_f,
                         conditions=wincap_bonus_condition,
                     ),
                     Distribution(
@@ -354,7 +448,7 @@ class GameConfig(Config):
                     Distribution(
                         criteria="wincap",
                         quota=0.001,
-                        win_criteria=float(_maxwin),
+                        win_criteria=_maxwin_f,
                         conditions=wincap_condition,
                     ),
                     Distribution(
@@ -390,7 +484,7 @@ class GameConfig(Config):
                 is_buybonus=False,
                 distributions=[
                     Distribution(criteria="wincap", quota=0.0025,
-                                 win_criteria=float(_maxwin), conditions=wincap_ante_condition),
+                                 win_criteria=_maxwin_f, conditions=wincap_ante_condition),
                     Distribution(criteria="freegame", quota=0.24,
                                  conditions=freegame_ante_condition),
                     Distribution(criteria="0", quota=0.30,
@@ -418,7 +512,7 @@ class GameConfig(Config):
                     Distribution(
                         criteria="wincap",
                         quota=0.03,
-                        win_criteria=float(_maxwin),
+                        win_criteria=_maxwin_f,
                         conditions=wincap_bonus_condition,
                     ),
                     Distribution(
@@ -429,3 +523,125 @@ class GameConfig(Config):
                 ],
             ),
         ]
+
+        self._freeze_sim_tables()
+        self._initialized = True
+
+    def _read_reels_interned(self, reel_path: str) -> list:
+        """read_reels_csv() with every symbol name interned.
+
+        Every cell drawn from a strip is then one of a handful of shared str
+        objects, so the evaluators' ``sym == wild`` style compares resolve on
+        identity.
+        """
+        return [[sys.intern(sym) for sym in reel] for reel in self.read_reels_csv(reel_path)]
+
+    def strip_to_ids(self, strip: list) -> np.ndarray:
+        """Symbol-name strip, as read_reels_csv() returns it, to int8 ids.
+
+        Shape (num_reels, strip_len), indexed [reel][stop] like the strip.
+        """
+        return np.asarray([[self.symbol_to_id[sym] for sym in reel] for reel in strip], dtype=np.int8)
+
+    def strip_symbol_counts(self, strip_ids: np.ndarray) -> np.ndarray:
+        """counts[reel, symbol_id]: stops showing that symbol on that reel.
+
+        int32, shape (num_reels, num_symbols), for closed-form hit-rate checks.
+        """
+        return np.stack([np.bincount(reel, minlength=len(self.id_to_symbol)) for reel in strip_ids]).astype(np.int32)
+
+    def _freeze_sim_tables(self) -> None:
+        """Make the numeric tables C-contiguous and read-only.
+
+        A batch kernel (or a device upload) can then take them as-is with no
+        defensive copy, and any accidental in-place write raises instead of
+        silently corrupting the shared tables.
+        """
+        for reel_id, strip in self.reel_ids.items():
+            self.reel_ids[reel_id] = np.ascontiguousarray(strip)
+        for arr in (
+            *self.reel_ids.values(),
+            *self.reel_symbol_counts.values(),
+            self.paytable_arr,
+            self.paytable_int,
+            self.scatter_mult_arr,
+            self.scatter_mult_int,
+            self.wild_ids,
+            self.scatter_ids,
+        ):
+            arr.setflags(write=False)
+
+    def get_sim_tables(self, reel_id: str) -> dict:
+        """Return the numeric tables a batch ways evaluator needs for one strip.
+
+        Plain ndarrays only (no dicts of symbol names), so the result can be
+        passed straight into a compiled or vectorised kernel:
+        reels (num_reels, strip_len) int8, paytable (num_symbols, num_reels + 1),
+        wild_ids / scatter_ids int8, scatter_mult indexed by scatter count, and
+        the wincap as a bet multiple. The *_int tables are the same pays in
+        int32 units of 1 / pay_scale of a bet.
+        """
+        return {
+            "reels": self.reel_ids[reel_id],
+            "paytable": self.paytable_arr,
+            "wild_ids": self.wild_ids,
+            "scatter_ids": self.scatter_ids,
+            "scatter_mult": self.scatter_mult_arr,
+            "paytable_int": self.paytable_int,
+            "scatter_mult_int": self.scatter_mult_int,
+            "pay_scale": self.pay_scale,
+            "wincap": float(self.wincap),
+        }
+
+    def dump_compiled(self, path: str) -> None:
+        """Write the numeric tables to one .npz bundle for batch workers.
+
+        Symbol names go in as a fixed-width string array, so the bundle loads
+        with allow_pickle=False. Per-strip tables are keyed reels_<id> and
+        symbol_counts_<id>.
+        """
+        arrays = {
+            "symbols": np.array(self.id_to_symbol),
+            "paytable": self.paytable_arr,
+            "paytable_int": self.paytable_int,
+            "scatter_mult": self.scatter_mult_arr,
+            "scatter_mult_int": self.scatter_mult_int,
+            "wild_ids": self.wild_ids,
+            "scatter_ids": self.scatter_ids,
+            "pay_scale": np.int32(self.pay_scale),
+            "wincap": np.float64(self.wincap),
+        }
+        for reel_id, strip in self.reel_ids.items():
+            arrays[f"reels_{reel_id}"] = strip
+            arrays[f"symbol_counts_{reel_id}"] = self.reel_symbol_counts[reel_id]
+        np.savez(path, **arrays)
+
+    @staticmethod
+    def load_compiled(path: str) -> dict:
+        """Read a dump_compiled() bundle into a dict of arrays.
+
+        Does not touch the reel CSVs or build a GameConfig. An .npz is a zip
+        archive, so members are read into memory rather than memory-mapped;
+        the bundle is a few KB.
+        """
+        with np.load(path, allow_pickle=False) as bundle:
+            return {name: bundle[name] for name in bundle.files}
+
+    @staticmethod
+    def compiled_sim_tables(bundle: dict, reel_id: str) -> dict:
+        """Return the get_sim_tables(reel_id) dict from a load_compiled() bundle.
+
+        Same keys and values, with pay_scale and wincap as plain Python
+        numbers, so batch code takes either source.
+        """
+        return {
+            "reels": bundle[f"reels_{reel_id}"],
+            "paytable": bundle["paytable"],
+            "wild_ids": bundle["wild_ids"],
+            "scatter_ids": bundle["scatter_ids"],
+            "scatter_mult": bundle["scatter_mult"],
+            "paytable_int": bundle["paytable_int"],
+            "scatter_mult_int": bundle["scatter_mult_int"],
+            "pay_scale": int(bundle["pay_scale"]),
+            "wincap": float(bundle["wincap"]),
+        }
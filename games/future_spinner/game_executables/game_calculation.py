@@ -8,11 +8,23 @@
 #   Layer 1 — Standalone pure functions
 #   -------------------------------------
 #   evaluate_ways_to_win()    works on raw list[list[str]] boards
+#   make_ways_evaluator_ids() bitmask ways evaluator for one integer-id board
+#   evaluate_ways_to_win_batch()  ways wins for N integer-id boards at once
+#   collect_wins()            batch wins as one record array (_WIN_DTYPE)
+#   sample_stops()            uniform reel stops for a batch of spins
+#   boards_from_stops()       integer-id boards for a batch of reel stops
+#   window_counts()           per-stop symbol counts for every reel of a strip
+#   board_names()             integer-id board back to symbol names
+#   simulate_base_batch()     per-spin base-game wins for N random spins
+#   simulate_base_parallel()  simulate_base_batch() split across processes
 #   check_scatter()           counts scatter symbols, looks up multiplier
 #   build_events()            serialises one spin to SDK-format events list
 #   calculate_total_payout()  integer-arithmetic centibets total
+#   pack_board()              packs an integer-id board into one int, 4 bits/cell
+#   count_symbol()            SWAR count of one symbol id on a packed board
+#   check_scatter_packed()    check_scatter() on a packed board
 #
-#   These four functions are callable without any SDK state and are used
+#   These functions are callable without any SDK state and are used
 #   directly by the __main__ test block and by the GameCalculation class below.
 #
 #   Layer 2 — SDK-compatible GameCalculation class
@@ -28,24 +40,32 @@ from __future__ import annotations
 import json
 import os
 import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
+import numpy as np
+
 # -- SDK path resolution -------------------------------------------------------
 # When this file is executed directly (e.g. `python game_calculation.py` for
 # the __main__ test block), Python adds only the script's own directory to
-# sys.path, making `src.*` imports fail.  The block below resolves the SDK
-# root (3 levels up: game_executables/ → future_spinner/ → games/ → math-sdk/)
-# and inserts it if not already present.  This is a no-op when the SDK is
-# installed as an editable package via `pip install -e .`.
-_SDK_ROOT = os.path.normpath(
-    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")
-)
-if _SDK_ROOT not in sys.path:
-    sys.path.insert(0, _SDK_ROOT)
+# sys.path, making `src.*` imports fail.  In that case the block below
+# resolves the SDK root (3 levels up: game_executables/ → future_spinner/ →
+# games/ → math-sdk/) and inserts it if not already present.  When `src` is
+# already importable (run.py, worker processes, `pip install -e .`) the first
+# import succeeds and no path work is done.
+try:
+    import src.executables.executables  # noqa: F401
+except ImportError:
+    _SDK_ROOT = os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")
+    )
+    if _SDK_ROOT not in sys.path:
+        sys.path.insert(0, _SDK_ROOT)
 
 # SDK imports are only needed when running inside the full simulation pipeline.
 # When this file is executed directly for testing (no venv / no zstandard),
-# we fall back to lightweight stubs so that the four standalone pure functions
+# we fall back to lightweight stubs so that the standalone pure functions
 # and the __main__ block run without the full SDK present.
 try:
     from src.executables.executables import Executables
@@ -68,11 +88,144 @@ except ImportError:
 
 # -- Module-level constants ----------------------------------------------------
 
-# Scatter multiplier table: {count → total-bet multiplier}
-# 0-2 scatters → no award; 3-5 scatters → instant multiplier on that spin.
+# Scatter multiplier table, indexed by count: _SCATTER_MULT_LUT[count] is the
+# total-bet multiplier. 0-2 scatters → no award; 3-5 scatters → instant
+# multiplier on that spin; counts past the end pay nothing.
 # True shipped values: 3 → 1x, 4 → 3x, 5 → 10x (used by the standalone test
-# layer only; the pipeline reads GameConfig.scatter_multiplier_table).
-_SCATTER_MULTIPLIER_TABLE: dict[int, int] = {3: 1, 4: 3, 5: 10}
+# layer only; the pipeline reads GameConfig.scatter_mult_lut).
+_SCATTER_MULT_LUT: tuple[int, ...] = (0, 0, 0, 1, 3, 10)
+
+# Skeleton of the reveal event every spin emits. build_events copies it and
+# fills in the board: dict.copy() of a small dict is a straight table copy,
+# faster than building the same literal. Key order matches the event
+# literal, so serialised output is unchanged.
+_REVEAL_TEMPLATE: dict = {"index": 0, "type": "reveal", "board": None, "gameType": "basegame"}
+
+# Low bit of every nibble of a 5x4 board packed by pack_board() (0x1111...).
+_NIBBLE_LOW_BITS: int = int("1" * 20, 16)
+
+
+# One batch ways win per record (see collect_wins()): spin index, symbol id,
+# kind, win in centibets, and the winning cells as a bitmask with bit
+# (reel * rows + row) set per cell.
+_WIN_DTYPE = np.dtype([
+    ("spin", "u4"),
+    ("sym",  "u1"),
+    ("kind", "u1"),
+    ("cb",   "i8"),
+    ("pos",  "u8"),
+])
+
+
+def _unpack_positions(packed: bytes) -> List[dict]:
+    """
+    Expand packed ``(reel << 4) | row`` codes to fresh ``{"reel", "row"}``
+    dicts, which callers own and may mutate.
+    """
+    return [{"reel": code >> 4, "row": code & 0xF} for code in packed]
+
+
+# -- Win record ----------------------------------------------------------------
+
+
+class WinRecord(Mapping):
+    """
+    One ways win from ``evaluate_ways_to_win()``.
+
+    Slotted rather than a dict: smaller per win and attribute reads skip the
+    dict hash. Positions are held as ``packed_positions`` bytes, one
+    ``(reel << 4) | row`` code per cell, and expanded to new dicts each time
+    ``positions`` is read.
+
+    A read-only ``Mapping`` over the keys of the old win dict, so
+    ``win["symbol"]``, ``"symbol" in win``, ``win.get()``, ``keys()`` and
+    ``dict(win)`` work for existing callers. It is not a ``dict``:
+    ``json.dumps()`` needs ``to_dict()``. ``from_dict()`` reads the dict form
+    back, so ``build_events()`` and ``calculate_total_payout()`` still take
+    plain win dicts.
+    """
+
+    __slots__ = (
+        "symbol",
+        "count",
+        "payout_multiplier",
+        "payout_centibets",
+        "packed_positions",
+    )
+
+    # Keys of the dict form, in order (the Mapping keys).
+    _FIELDS = ("symbol", "count", "payout_multiplier", "payout_centibets", "positions")
+
+    def __init__(
+        self,
+        symbol: str,
+        count: int,
+        payout_multiplier: float,
+        packed_positions: bytes,
+        payout_centibets: int = None,
+    ):
+        self.symbol = symbol
+        self.count = count
+        self.payout_multiplier = payout_multiplier
+        self.packed_positions = packed_positions
+        if payout_centibets is None:
+            payout_centibets = int(round(payout_multiplier * 100))
+        self.payout_centibets = payout_centibets
+
+    @property
+    def positions(self) -> List[dict]:
+        """Win cells as ``{"reel": int, "row": int}`` dicts."""
+        return _unpack_positions(self.packed_positions)
+
+    def __getitem__(self, key: str):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def __contains__(self, key) -> bool:
+        return key in self._FIELDS
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WinRecord):
+            # Against another mapping, e.g. a plain win dict: compare items.
+            return Mapping.__eq__(self, other)
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (
+            f"WinRecord({self.symbol!r}, count={self.count}, "
+            f"payout_multiplier={self.payout_multiplier})"
+        )
+
+    def to_dict(self) -> dict:
+        """Plain-dict form, with positions expanded to dicts."""
+        return {key: getattr(self, key) for key in self._FIELDS}
+
+    @classmethod
+    def from_dict(cls, win: dict) -> "WinRecord":
+        """
+        Record for a plain win dict. ``payout_centibets`` is optional, as in
+        dicts built before it existed; it is then rounded from
+        ``payout_multiplier``.
+        """
+        return cls(
+            win["symbol"],
+            win["count"],
+            win["payout_multiplier"],
+            bytes((pos["reel"] << 4) | pos["row"] for pos in win["positions"]),
+            win.get("payout_centibets"),
+        )
+
+
+def _as_win_records(line_wins: list) -> List[WinRecord]:
+    """``line_wins`` with any plain win dicts converted by ``from_dict()``."""
+    return [w if isinstance(w, WinRecord) else WinRecord.from_dict(w) for w in line_wins]
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -84,7 +237,7 @@ def evaluate_ways_to_win(
     board: List[List[str]],
     paytable: dict,
     wild_symbol: str = "W",
-) -> List[dict]:
+) -> List[WinRecord]:
     """
     Evaluate all ways-to-win combinations on a 5×4 reel grid.
 
@@ -102,8 +255,9 @@ def evaluate_ways_to_win(
 
     Returns
     -------
-    list[dict]
-        One entry per distinct winning symbol:
+    list[WinRecord]
+        One entry per distinct winning symbol, with these fields (also
+        readable as ``win["symbol"]`` etc.):
 
         .. code-block:: python
 
@@ -111,9 +265,12 @@ def evaluate_ways_to_win(
                 "symbol":            str,   # winning symbol name
                 "count":             int,   # contributing reels (3, 4, or 5)
                 "payout_multiplier": float, # total win in bet-multiples
+                "payout_centibets":  int,   # same win in centibets (x 100)
                 "positions":         list,  # [{"reel": int, "row": int}, ...]
             }
 
+        ``positions`` is expanded on read from ``packed_positions``.
+
     Ways rule
     ---------
     A win is formed strictly left-to-right.  For each **regular** (non-Wild)
@@ -146,59 +303,50 @@ def evaluate_ways_to_win(
     """
     num_reels = len(board)
 
-    # -- Pre-compute Wild positions per reel -----------------------------------
-    # Stored as a list of position-dicts so they can be appended directly to the
-    # winning positions list without further filtering.
-    wild_by_reel: List[List[dict]] = [
-        [{"reel": reel, "row": row}
-         for row, sym in enumerate(board[reel])
-         if sym == wild_symbol]
-        for reel in range(num_reels)
-    ]
+    # -- Pre-compute Wild counts per reel --------------------------------------
+    # Counts drive the ways product. Wild positions are only needed for a
+    # winning symbol, so they are collected in _win_positions() on a win.
+    wild_counts: List[int] = [reel.count(wild_symbol) for reel in board]
 
     # -- Identify regular symbols present on reel 0 ----------------------------
     # Wilds on reel 0 are excluded: they contribute to OTHER symbols' wins but
     # never start an independent win (no Wild entry in the paytable).
     reel0_symbols = {sym for sym in board[0] if sym != wild_symbol}
 
-    wins: List[dict] = []
+    wins: List[WinRecord] = []
 
     for symbol in reel0_symbols:
         kind      = 0   # number of consecutive contributing reels
         ways      = 1   # product of per-reel contributions
-        positions: List[dict] = []
 
+        # Count first: list.count runs in C, and most reel-0 symbols never
+        # reach a paytable entry, so their positions are never needed.
         for reel in range(num_reels):
-            # Regular-symbol positions on this reel
-            sym_pos = [
-                {"reel": reel, "row": row}
-                for row, sym in enumerate(board[reel])
-                if sym == symbol
-            ]
-
             # Reel contribution = matching regular symbols + wilds
-            reel_count = len(sym_pos) + len(wild_by_reel[reel])
+            reel_count = board[reel].count(symbol) + wild_counts[reel]
 
             if reel_count == 0:
                 break   # chain broken — no further reels contribute
 
             kind      += 1
             ways      *= reel_count
-            positions.extend(sym_pos)
-            positions.extend(wild_by_reel[reel])
 
         # Only record a win if the (kind, symbol) key exists in the paytable
-        # (requires at least 3 contributing reels with a valid paytable entry)
-        if (kind, symbol) in paytable:
-            payout_per_way = paytable[(kind, symbol)]
+        # (requires at least 3 contributing reels with a valid paytable entry).
+        # One lookup: the key tuple is built and hashed once, not twice.
+        payout_per_way = paytable.get((kind, symbol))
+        if payout_per_way is not None:
             total_payout   = round(payout_per_way * ways, 2)
+            # Pays have at most 2 decimals, so the per-way pay is a whole
+            # number of centibets and the win is exact in ints.
             wins.append(
-                {
-                    "symbol":            symbol,
-                    "count":             kind,
-                    "payout_multiplier": total_payout,
-                    "positions":         positions,
-                }
+                WinRecord(
+                    symbol,
+                    kind,
+                    total_payout,
+                    _win_positions(board, symbol, kind, wild_symbol),
+                    int(payout_per_way * 100 + 0.5) * ways,
+                )
             )
 
     return wins
@@ -207,6 +355,103 @@ def evaluate_ways_to_win(
 # -----------------------------------------------------------------------------
 
 
+def _win_positions(
+    board: List[List[str]],
+    symbol: str,
+    kind: int,
+    wild_symbol: str = "W",
+) -> bytes:
+    """
+    Packed positions of a ``kind``-reel win on ``symbol``: per reel, the
+    symbol's cells then the Wild cells, in the same order
+    ``evaluate_ways_to_win()`` reports them.
+    """
+    positions = bytearray()
+    for reel in range(kind):
+        reel_syms = board[reel]
+        positions.extend((reel << 4) | row for row, sym in enumerate(reel_syms) if sym == symbol)
+        positions.extend((reel << 4) | row for row, sym in enumerate(reel_syms) if sym == wild_symbol)
+    return bytes(positions)
+
+
+def make_ways_evaluator_ids(
+    paytable_int: np.ndarray,
+    wild_ids: np.ndarray,
+):
+    """
+    Return ``evaluate(board_ids)``: ways wins for one integer-id board.
+
+    Each reel is reduced to a presence bitmask (bit ``symbol_id`` set when the
+    symbol shows; every bit when a Wild does), and the chain is walked for all
+    reel-0 symbols at once with integer ``&``: a symbol's kind is the reel
+    where its bit first drops out. Only symbols that end on a paying kind are
+    then counted for their ways. Same rule as ``evaluate_ways_to_win()``;
+    positions are not built.
+
+    Parameters
+    ----------
+    paytable_int : np.ndarray
+        ``GameConfig.paytable_int`` (``[symbol_id, kind]`` centibets).
+    wild_ids : np.ndarray
+        ``GameConfig.wild_ids``.
+
+    Returns
+    -------
+    callable
+        ``evaluate(board_ids)`` on ``board_ids[reel][row]`` ints (a nested
+        list, e.g. ``boards_from_stops(...)[i].tolist()``), returning
+        ``[(symbol_id, kind, centibets), ...]`` sorted by symbol id.
+    """
+    pays = paytable_int.tolist()
+    pay_mask = sum(1 << sid for sid, row in enumerate(pays) if any(row))
+    wilds = [int(w) for w in wild_ids]
+    wild_mask = sum(1 << w for w in wilds)
+    all_mask = (1 << len(pays)) - 1
+
+    def evaluate(board_ids: List[List[int]]) -> List[tuple]:
+        presence = []
+        for reel in board_ids:
+            mask = 0
+            for sid in reel:
+                mask |= 1 << sid
+            presence.append(mask)
+        # Reel 0 starts wins only for the symbols actually on it.
+        live = presence[0] & pay_mask & ~wild_mask
+        ended = []  # (symbol_id, kind) where each chain stops
+        kind = 1
+        for mask in presence[1:]:
+            if not live:
+                break
+            reached = live & (all_mask if mask & wild_mask else mask)
+            stopped = live & ~reached
+            while stopped:
+                bit = stopped & -stopped
+                stopped ^= bit
+                ended.append((bit.bit_length() - 1, kind))
+            live = reached
+            kind += 1
+        while live:
+            bit = live & -live
+            live ^= bit
+            ended.append((bit.bit_length() - 1, kind))
+
+        wins = []
+        for sid, kind in ended:
+            pay = pays[sid][kind]
+            if pay:
+                ways = 1
+                for reel in board_ids[:kind]:
+                    ways *= reel.count(sid) + sum(reel.count(w) for w in wilds)
+                wins.append((sid, kind, pay * ways))
+        wins.sort()
+        return wins
+
+    return evaluate
+
+
+# -----------------------------------------------------------------------------
+
+
 def check_scatter(
     board: List[List[str]],
     scatter_symbol: str = "S",
@@ -231,6 +476,8 @@ def check_scatter(
 
         {
             "count":      int,  # total scatter symbols on board  (0 – 5)
+            "positions":  list, # [{"reel": int, "row": int}, ...] when
+                                # count >= 3, else []
             "multiplier": int,  # total-bet multiplier to award
                                 # 0  if count < 3
                                 # 5  if count == 3
@@ -256,25 +503,512 @@ def check_scatter(
         check_scatter(board_with_5_scatters)
         # → {"count": 5, "multiplier": 50}
     """
-    count = sum(
-        1
-        for reel in board
-        for sym  in reel
+    # One C-level list.count per reel rather than a Python compare per cell.
+    count = sum(reel.count(scatter_symbol) for reel in board)
+
+    # Positions are only walked for an awarding count; build_events reuses
+    # them instead of rescanning the board.
+    positions = [
+        {"reel": reel, "row": row}
+        for reel, reel_syms in enumerate(board)
+        for row,  sym      in enumerate(reel_syms)
         if sym == scatter_symbol
-    )
+    ] if count >= 3 else []
 
     return {
         "count":      count,
-        "multiplier": _SCATTER_MULTIPLIER_TABLE.get(count, 0),
+        "multiplier": _SCATTER_MULT_LUT[count] if count < len(_SCATTER_MULT_LUT) else 0,
+        "positions":  positions,
     }
 
 
 # -----------------------------------------------------------------------------
 
 
+def pack_board(board_ids: List[List[int]]) -> int:
+    """
+    Pack an integer-id board into a single int, one 4-bit nibble per cell.
+
+    Cells are packed reel-major (``board_ids[0][0]`` in the lowest nibble).
+    Symbol ids come from ``GameConfig.symbol_to_id`` (0 - 9), so each fits in
+    a nibble; a 5x4 board takes 80 bits, which a Python int holds directly
+    without splitting across two 64-bit words.
+
+    Parameters
+    ----------
+    board_ids : list[list[int]]
+        ``board_ids[reel][row]`` symbol ids.
+
+    Returns
+    -------
+    int
+        Packed board for ``count_symbol()``.
+    """
+    packed = 0
+    shift = 0
+    for reel in board_ids:
+        for sym_id in reel:
+            packed |= int(sym_id) << shift
+            shift += 4
+    return packed
+
+
+# -----------------------------------------------------------------------------
+
+
+def count_symbol(packed: int, sym_id: int, num_cells: int = 20) -> int:
+    """
+    Count cells holding ``sym_id`` on a board packed by ``pack_board()``.
+
+    SWAR: XOR with ``sym_id`` splatted into every nibble zeroes exactly the
+    matching cells; folding each nibble onto its low bit and popcounting gives
+    the non-matching cells, with no per-cell loop.
+
+    Parameters
+    ----------
+    packed : int
+        Board from ``pack_board()``.
+    sym_id : int
+        Symbol id to count (e.g. ``GameConfig.scatter_id``).
+    num_cells : int
+        Cells on the board (default 20 for 5x4).
+
+    Returns
+    -------
+    int
+        Number of cells equal to ``sym_id``.
+    """
+    ones = _NIBBLE_LOW_BITS if num_cells == 20 else int("1" * num_cells, 16)
+    diff = packed ^ (sym_id * ones)
+    diff |= diff >> 1
+    diff |= diff >> 2
+    return num_cells - (diff & ones).bit_count()
+
+
+# -----------------------------------------------------------------------------
+
+
+def check_scatter_packed(
+    packed: int,
+    scatter_id: int,
+    num_rows: int = 4,
+    num_cells: int = 20,
+) -> dict:
+    """
+    ``check_scatter()`` for a board already packed by ``pack_board()``.
+
+    The count is one ``count_symbol()`` popcount, so a losing board (fewer
+    than 3 scatters) costs no per-cell work; positions are only read back
+    from the nibbles for an awarding count. Takes the packed int rather than
+    the board so the packing is paid once upstream, where the board is
+    drawn, not per check.
+
+    Parameters
+    ----------
+    packed : int
+        Board from ``pack_board()``.
+    scatter_id : int
+        ``GameConfig.scatter_id``.
+    num_rows : int
+        Rows per reel (default 4).
+    num_cells : int
+        Cells on the board (default 20 for 5x4).
+
+    Returns
+    -------
+    dict
+        Same keys and values as ``check_scatter()`` on the named board.
+    """
+    count = count_symbol(packed, scatter_id, num_cells)
+    positions = [
+        {"reel": cell // num_rows, "row": cell % num_rows}
+        for cell in range(num_cells)
+        if (packed >> (cell * 4)) & 0xF == scatter_id
+    ] if count >= 3 else []
+
+    return {
+        "count":      count,
+        "multiplier": _SCATTER_MULT_LUT[count] if count < len(_SCATTER_MULT_LUT) else 0,
+        "positions":  positions,
+    }
+
+
+# -----------------------------------------------------------------------------
+
+
+def evaluate_ways_to_win_batch(
+    boards_ids: np.ndarray,
+    paytable_int: np.ndarray,
+    wild_ids: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Ways wins for N boards at once, on integer symbol ids.
+
+    Same rule as ``evaluate_ways_to_win()``, but vectorised over boards and
+    symbols together: one ``bincount`` gives every board's per-reel count of
+    every symbol, and the chain length, ways product and pay for all
+    ``(board, symbol)`` pairs follow from whole-array operations, with no
+    Python loop. Meant for bulk runs over pre-drawn boards; positions are not
+    built. Temporaries are ``(N, reels, symbols)`` int64, so very large runs
+    should be fed in chunks.
+
+    Parameters
+    ----------
+    boards_ids : np.ndarray
+        ``(N, reels, rows)`` symbol ids from ``GameConfig.symbol_to_id``.
+    paytable_int : np.ndarray
+        ``GameConfig.paytable_int``: ``[symbol_id, kind]`` per-way pay in
+        centibets, 0 where nothing pays (Wild, Scatter, kind < 3).
+    wild_ids : np.ndarray
+        ``GameConfig.wild_ids``.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Parallel ``(spin_idx, symbol_id, kind, centibets)`` arrays, one entry
+        per win, ordered by spin then symbol id.
+    """
+    boards_ids = np.asarray(boards_ids)
+    num_boards, num_reels, num_rows = boards_ids.shape
+    num_symbols = paytable_int.shape[0]
+
+    # counts[board, reel, symbol]: one bincount over (board, reel, symbol) bins.
+    bins = np.arange(num_boards * num_reels, dtype=np.int64)[:, None] * num_symbols
+    bins = bins + boards_ids.reshape(num_boards * num_reels, num_rows)
+    counts = np.bincount(bins.ravel(), minlength=num_boards * num_reels * num_symbols)
+    counts = counts.reshape(num_boards, num_reels, num_symbols)
+    return _ways_wins_from_counts(counts, paytable_int, wild_ids)
+
+
+def _ways_wins_from_counts(
+    counts: np.ndarray,
+    paytable_int: np.ndarray,
+    wild_ids: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Ways wins from ``counts[board, reel, symbol]`` int64 cell counts."""
+    num_reels, num_symbols = counts.shape[1:]
+
+    # Reel contribution of every symbol = its own cells + that reel's wilds.
+    contrib = counts + counts[:, :, wild_ids].sum(axis=2)[:, :, None]
+    # kind = index of the first empty reel, or every reel if none is.
+    broken = contrib == 0
+    kind = np.where(broken.any(axis=1), broken.argmax(axis=1), num_reels)
+    # Ways over the first `kind` reels: running product read at kind - 1.
+    ways = np.cumprod(np.where(broken, 1, contrib), axis=1)
+    ways = np.take_along_axis(ways, np.maximum(kind - 1, 0)[:, None, :], axis=1)[:, 0, :]
+
+    centibets = paytable_int[np.arange(num_symbols), kind] * ways
+    # Only symbols on reel 0 start a win; a Wild-only reel 0 does not.
+    centibets[counts[:, 0, :] == 0] = 0
+
+    spin_idx, symbol_id = np.nonzero(centibets)
+    return (
+        spin_idx,
+        symbol_id.astype(np.int8),
+        kind[spin_idx, symbol_id].astype(np.int8),
+        centibets[spin_idx, symbol_id].astype(np.int64),
+    )
+
+
+# -----------------------------------------------------------------------------
+
+
+def collect_wins(
+    boards_ids: np.ndarray,
+    paytable_int: np.ndarray,
+    wild_ids: np.ndarray,
+) -> np.recarray:
+    """
+    Ways wins for N boards as one ``_WIN_DTYPE`` record array.
+
+    Wraps ``evaluate_ways_to_win_batch()`` and adds each win's cells as a
+    ``pos`` bitmask (bit ``reel * rows + row``; the symbol's and the Wilds'
+    cells on the first ``kind`` reels), so a whole run's wins sit in one
+    contiguous buffer instead of per-win objects. Aggregates are then single
+    numpy calls, e.g. per-spin ways totals in centibets::
+
+        wins = collect_wins(boards_ids, config.paytable_int, config.wild_ids)
+        totals = np.bincount(wins.spin, weights=wins.cb, minlength=len(boards_ids))
+
+    Parameters are as for ``evaluate_ways_to_win_batch()``; boards must have
+    at most 64 cells.
+
+    Returns
+    -------
+    np.recarray
+        One record per win, ordered by spin then symbol id.
+    """
+    boards_ids = np.asarray(boards_ids)
+    num_reels, num_rows = boards_ids.shape[1:]
+    assert num_reels * num_rows <= 64, "pos bitmask holds at most 64 cells."
+    spin_idx, symbol_id, kind, centibets = evaluate_ways_to_win_batch(boards_ids, paytable_int, wild_ids)
+
+    wins = np.empty(spin_idx.size, dtype=_WIN_DTYPE).view(np.recarray)
+    wins.spin = spin_idx
+    wins.sym = symbol_id
+    wins.kind = kind
+    wins.cb = centibets
+
+    # (wins, reels, rows) winning cells: the symbol or a Wild, on reels < kind.
+    boards = boards_ids[spin_idx]
+    hit = (boards == symbol_id[:, None, None]) | np.isin(boards, wild_ids)
+    hit &= np.arange(num_reels)[None, :, None] < kind[:, None, None]
+    bits = np.left_shift(np.uint64(1), np.arange(num_reels * num_rows, dtype=np.uint64))
+    # Each cell has its own bit, so the sum is the bitwise OR.
+    wins.pos = (hit.reshape(spin_idx.size, num_reels * num_rows) * bits).sum(axis=1, dtype=np.uint64)
+    return wins
+
+
+# -----------------------------------------------------------------------------
+
+
+def sample_stops(
+    reels: np.ndarray,
+    num_spins: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Uniform stop positions on every reel of one strip, for ``num_spins`` spins.
+
+    Every stop is equally likely, so one bounded integer draw covers the
+    whole batch. For batch analysis only: the SDK ``draw_board()`` keeps its
+    own ``random.randrange`` stream, which the published books depend on.
+
+    Parameters
+    ----------
+    reels : np.ndarray
+        ``(num_reels, strip_len)`` symbol ids (``GameConfig.reel_ids[reel_id]``).
+    num_spins : int
+        Spins to draw.
+    rng : np.random.Generator
+        Source of the stop positions.
+
+    Returns
+    -------
+    np.ndarray
+        ``(num_spins, num_reels)`` stop positions.
+    """
+    num_reels, strip_len = reels.shape
+    return rng.integers(0, strip_len, size=(num_spins, num_reels))
+
+
+# -----------------------------------------------------------------------------
+
+
+def boards_from_stops(
+    reels: np.ndarray,
+    stops: np.ndarray,
+    num_rows: int = 4,
+) -> np.ndarray:
+    """
+    Integer-id boards for a batch of stop positions.
+
+    Same window as the SDK ``create_board_reelstrips()``: each reel shows
+    ``num_rows`` consecutive stops from its stop position, wrapping at the end
+    of the strip.
+
+    Parameters
+    ----------
+    reels : np.ndarray
+        ``(num_reels, strip_len)`` symbol ids (``GameConfig.reel_ids[reel_id]``).
+    stops : np.ndarray
+        ``(N, num_reels)`` stop positions (``sample_stops()``).
+    num_rows : int
+        Rows per reel (default 4).
+
+    Returns
+    -------
+    np.ndarray
+        ``(N, num_reels, num_rows)`` symbol ids.
+    """
+    num_reels, strip_len = reels.shape
+    rows = (np.asarray(stops)[:, :, None] + np.arange(num_rows)) % strip_len
+    return reels[np.arange(num_reels)[:, None], rows]
+
+
+# -----------------------------------------------------------------------------
+
+
+def window_counts(
+    reels: np.ndarray,
+    num_symbols: int,
+    num_rows: int = 4,
+) -> np.ndarray:
+    """
+    Symbol counts of the window shown at every stop of every reel.
+
+    ``table[reel, stop, symbol]`` is how many of the ``num_rows`` cells that
+    ``boards_from_stops()`` would show for ``stop`` on ``reel`` hold
+    ``symbol``. The table is ``num_reels * strip_len`` rows, so a batch of
+    stops maps to its ``(N, reels, symbols)`` counts with one gather,
+    ``table[np.arange(num_reels), stops]``, instead of building boards and
+    counting cells.
+
+    Parameters
+    ----------
+    reels : np.ndarray
+        ``(num_reels, strip_len)`` symbol ids (``GameConfig.reel_ids[reel_id]``).
+    num_symbols : int
+        Number of symbol ids (``paytable_int.shape[0]``).
+    num_rows : int
+        Rows per reel (default 4).
+
+    Returns
+    -------
+    np.ndarray
+        ``(num_reels, strip_len, num_symbols)`` int64 counts.
+    """
+    strip_len = reels.shape[1]
+    rows = (np.arange(strip_len)[:, None] + np.arange(num_rows)) % strip_len
+    windows = reels[:, rows]
+    return (windows[..., None] == np.arange(num_symbols)).sum(axis=2, dtype=np.int64)
+
+
+# -----------------------------------------------------------------------------
+
+
+def board_names(board_ids: np.ndarray, id_to_symbol) -> List[List[str]]:
+    """
+    Symbol-name board for one integer-id board.
+
+    The batch paths carry boards as small int arrays; this converts a single
+    board back to the ``list[list[str]]`` form the scalar functions and
+    ``build_events()`` take, e.g. to emit events for selected spins of a
+    batch run.
+
+    Parameters
+    ----------
+    board_ids : np.ndarray
+        ``(reels, rows)`` symbol ids, e.g. one entry of ``boards_from_stops()``.
+    id_to_symbol : sequence of str
+        ``GameConfig.id_to_symbol``.
+    """
+    return [[id_to_symbol[sym_id] for sym_id in reel] for reel in np.asarray(board_ids).tolist()]
+
+
+# -----------------------------------------------------------------------------
+
+
+def simulate_base_batch(
+    tables: dict,
+    num_spins: int,
+    rng: np.random.Generator,
+    num_rows: int = 4,
+) -> np.ndarray:
+    """
+    Per-spin base-game win for ``num_spins`` random spins, in centibets.
+
+    Draws every stop in one call, reads each spin's per-reel symbol counts
+    from the ``window_counts()`` table and evaluates the batch with the same
+    ways rule as ``evaluate_ways_to_win_batch()`` plus a scatter count, so a
+    Monte-Carlo check of the base game's ways + instant scatter return costs
+    a few numpy passes rather than a Python loop per spin. Spins are plain
+    reel draws at the 1x meter: no free spins, wincap, or distribution
+    criteria, and no resampling of trigger boards. For analysis only; the
+    SDK pipeline keeps its own random stream, which the books depend on.
+
+    Parameters
+    ----------
+    tables : dict
+        ``GameConfig.get_sim_tables(reel_id)``, or the same tables read back
+        from a ``dump_compiled()`` bundle with
+        ``GameConfig.compiled_sim_tables(GameConfig.load_compiled(path), reel_id)``.
+    num_spins : int
+        Spins to draw.
+    rng : np.random.Generator
+        Source of the stop positions.
+    num_rows : int
+        Rows per reel (default 4).
+
+    Returns
+    -------
+    np.ndarray
+        ``(num_spins,)`` int64 wins in centibets; ``mean() / 100`` is the
+        base-game return per unit bet.
+    """
+    reels = tables["reels"]
+    num_reels = reels.shape[0]
+    stops = sample_stops(reels, num_spins, rng)
+    # Per-reel symbol counts straight from the stop table; no boards are built.
+    table = window_counts(reels, tables["paytable_int"].shape[0], num_rows)
+    counts = table[np.arange(num_reels), stops]
+
+    spin_idx, _, _, centibets = _ways_wins_from_counts(counts, tables["paytable_int"], tables["wild_ids"])
+    # Per-spin sums of whole centibets stay exact in float64 weights.
+    totals = np.bincount(spin_idx, weights=centibets, minlength=num_spins).astype(np.int64)
+
+    scatter_counts = counts[:, :, tables["scatter_ids"]].sum(axis=(1, 2))
+    totals += np.take(tables["scatter_mult_int"], scatter_counts, mode="clip")
+    return totals
+
+
+# -----------------------------------------------------------------------------
+
+
+def _simulate_base_chunk(args: tuple) -> np.ndarray:
+    """Worker for simulate_base_parallel(): one seeded stream, run in batches."""
+    tables, seed, num_spins, batch_size, num_rows = args
+    rng = np.random.default_rng(seed)
+    parts = []
+    for start in range(0, num_spins, batch_size):
+        parts.append(simulate_base_batch(tables, min(batch_size, num_spins - start), rng, num_rows))
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+
+def simulate_base_parallel(
+    tables: dict,
+    num_spins: int,
+    num_workers: int = None,
+    seed: int = 0,
+    batch_size: int = 100_000,
+    num_rows: int = 4,
+) -> np.ndarray:
+    """
+    ``simulate_base_batch()`` for large runs, split across worker processes.
+
+    Each worker gets an independent stream from
+    ``np.random.SeedSequence(seed).spawn(num_workers)`` and draws its share in
+    batches of ``batch_size`` spins, which bounds the per-process numpy
+    temporaries. Results are concatenated in worker order, so a given
+    ``(seed, num_workers)`` always reproduces the same array.
+
+    Parameters
+    ----------
+    tables : dict
+        ``GameConfig.get_sim_tables(reel_id)``; pickled once per worker.
+    num_spins : int
+        Total spins to draw.
+    num_workers : int
+        Worker processes (default: the CPUs this process may run on,
+        ``os.sched_getaffinity(0)`` where available).
+    seed : int
+        Root seed for the worker streams.
+    batch_size : int
+        Spins per ``simulate_base_batch()`` call inside a worker.
+    num_rows : int
+        Rows per reel (default 4).
+
+    Returns
+    -------
+    np.ndarray
+        ``(num_spins,)`` int64 wins in centibets.
+    """
+    if not num_workers:
+        # CPUs this process may run on, as run.fit_threads() counts them.
+        num_workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    seeds = np.random.SeedSequence(seed).spawn(num_workers)
+    shares = [num_spins // num_workers + (i < num_spins % num_workers) for i in range(num_workers)]
+    jobs = [(tables, s, n, batch_size, num_rows) for s, n in zip(seeds, shares)]
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        return np.concatenate(list(pool.map(_simulate_base_chunk, jobs)))
+
+
+# -----------------------------------------------------------------------------
+
+
 def build_events(
     board: List[List[str]],
-    line_wins: List[dict],
+    line_wins: list,
     scatter_result: dict,
     total_win_multiplier: float,
 ) -> List[dict]:
@@ -290,11 +1024,11 @@ def build_events(
     ----------
     board : list[list[str]]
         ``board[reel][row]`` — raw board of symbol-name strings.
-    line_wins : list[dict]
-        Output of ``evaluate_ways_to_win()``.  Each entry has keys
-        ``symbol``, ``count``, ``payout_multiplier``, ``positions``.
+    line_wins : list[WinRecord | dict]
+        Output of ``evaluate_ways_to_win()``; plain win dicts are also taken.
     scatter_result : dict
-        Output of ``check_scatter()``.  Keys: ``count``, ``multiplier``.
+        Output of ``check_scatter()``.  Keys: ``count``, ``multiplier``,
+        ``positions``.
     total_win_multiplier : float
         Total spin payout in bet-multiples (ways wins + scatter win combined).
         Example: 55.0 for a 55× win.  Used for ``setTotalWin`` / ``finalWin``.
@@ -320,7 +1054,7 @@ def build_events(
 
     Amount encoding
     ---------------
-    *   All amounts → ``int(round(value * 100))``
+    *   All amounts → ``int(value * 100 + 0.5)`` (non-negative, whole centibets)
     *   ``total_win_multiplier`` 55.0 → 5500 centibets
     *   Scatter 5× → 500 centibets
     *   Ways win 50.0× → 5000 centibets
@@ -347,85 +1081,88 @@ def build_events(
     ``setTotalWin`` / ``finalWin``
         Both use ``total_win_multiplier`` converted to centibets.
     """
+    # Each event's "index" is its list position, read from len(events) as the
+    # SDK event helpers do. The key itself stays: SDK books carry it.
     events: List[dict] = []
-    idx = 0
+
+    # Amounts are non-negative and within float noise of a whole centibet, so
+    # int(x * 100 + 0.5) rounds them exactly like int(round(x * 100)) with one
+    # builtin call fewer. The spin total is converted once and reused.
+    total_centibets = int(total_win_multiplier * 100 + 0.5)
 
     # -- 1. reveal -------------------------------------------------------------
     board_client = [
         [{"name": sym} for sym in reel]
         for reel in board
     ]
-    events.append(
-        {
-            "index":    idx,
-            "type":     "reveal",
-            "board":    board_client,
-            "gameType": "basegame",
-        }
-    )
-    idx += 1
+    reveal = _REVEAL_TEMPLATE.copy()
+    reveal["board"] = board_client
+    events.append(reveal)
 
     # -- 2. winInfo + setWin (ways wins) ---------------------------------------
     if line_wins:
         # Convert each win to SDK winInfo format:
         #   count → kind  (SDK uses "kind", standalone uses "count")
         #   payout_multiplier (float bet-multiple) → win (int centibets)
-        wins_sdk = [
-            {
-                "symbol":    w["symbol"],
-                "kind":      w["count"],
-                "win":       int(round(w["payout_multiplier"] * 100)),
-                "positions": w["positions"],
-                "meta": {
-                    # 'ways' mirrors SDK Ways meta; here it equals the
-                    # total ways count (= payout_multiplier / paytable_unit)
-                    "ways":           w["count"],
-                    "globalMult":     1,
-                    "winWithoutMult": int(round(w["payout_multiplier"] * 100)),
-                    "symbolMult":     0,
-                },
-            }
-            for w in line_wins
-        ]
-        ways_total_centibets = sum(e["win"] for e in wins_sdk)
+        wins_sdk = []
+        ways_total_centibets = 0
+        for w in _as_win_records(line_wins):
+            win_cb = w.payout_centibets
+            ways_total_centibets += win_cb
+            wins_sdk.append(
+                {
+                    "symbol":    w.symbol,
+                    "kind":      w.count,
+                    "win":       win_cb,
+                    "positions": w.positions,
+                    "meta": {
+                        # 'ways' mirrors SDK Ways meta; here it equals the
+                        # total ways count (= payout_multiplier / paytable_unit)
+                        "ways":           w.count,
+                        "globalMult":     1,
+                        "winWithoutMult": win_cb,
+                        "symbolMult":     0,
+                    },
+                }
+            )
 
         events.append(
             {
-                "index":    idx,
+                "index":    len(events),
                 "type":     "winInfo",
                 "totalWin": ways_total_centibets,
                 "wins":     wins_sdk,
             }
         )
-        idx += 1
 
         # setWin — shows running spin-win after ways evaluation only
         events.append(
             {
-                "index":    idx,
+                "index":    len(events),
                 "type":     "setWin",
                 "amount":   ways_total_centibets,
                 "winLevel": "standard",
             }
         )
-        idx += 1
 
     # -- 3. scatterInfo + setWin (scatter award) -------------------------------
     if scatter_result["multiplier"] > 0:
-        # Gather scatter symbol positions directly from the board string grid.
-        # (The board uses "S" as the scatter symbol name.)
-        scatter_positions = [
-            {"reel": reel, "row": row}
-            for reel, reel_syms in enumerate(board)
-            for row,  sym      in enumerate(reel_syms)
-            if sym == "S"
-        ]
+        # Positions come from check_scatter(); a hand-built scatter_result
+        # without them falls back to scanning the board ("S" is the scatter).
+        scatter_positions = scatter_result.get("positions")
+        if scatter_positions is None:
+            scatter_positions = [
+                {"reel": reel, "row": row}
+                for reel, reel_syms in enumerate(board)
+                for row,  sym      in enumerate(reel_syms)
+                if sym == "S"
+            ]
         scatter_centibets = scatter_result["multiplier"] * 100  # int × int
 
         # Custom event type — not in SDK EventConstants; front end must handle.
         events.append(
             {
-                "index":      idx,
+                "index":      len(events),
                 "type":       "scatterInfo",
                 "count":      scatter_result["count"],
                 "multiplier": scatter_result["multiplier"],
@@ -433,36 +1170,31 @@ def build_events(
                 "positions":  scatter_positions,
             }
         )
-        idx += 1
 
         # setWin — updated total after scatter is added (ways + scatter)
-        total_centibets = int(round(total_win_multiplier * 100))
         events.append(
             {
-                "index":    idx,
+                "index":    len(events),
                 "type":     "setWin",
                 "amount":   total_centibets,
                 "winLevel": "standard",
             }
         )
-        idx += 1
 
     # -- 4. setTotalWin --------------------------------------------------------
     # Always emitted; amount may be 0 for a losing spin.
-    total_centibets = int(round(total_win_multiplier * 100))
     events.append(
         {
-            "index":  idx,
+            "index":  len(events),
             "type":   "setTotalWin",
             "amount": total_centibets,
         }
     )
-    idx += 1
 
     # -- 5. finalWin -----------------------------------------------------------
     events.append(
         {
-            "index":  idx,
+            "index":  len(events),
             "type":   "finalWin",
             "amount": total_centibets,
         }
@@ -475,7 +1207,7 @@ def build_events(
 
 
 def calculate_total_payout(
-    line_wins: List[dict],
+    line_wins: list,
     scatter_result: dict,
 ) -> int:
     """
@@ -483,9 +1215,8 @@ def calculate_total_payout(
 
     Parameters
     ----------
-    line_wins : list[dict]
-        Output of ``evaluate_ways_to_win()``.  Each entry must have a
-        ``"payout_multiplier"`` key (float, bet-multiples).
+    line_wins : list[WinRecord | dict]
+        Output of ``evaluate_ways_to_win()``; plain win dicts are also taken.
     scatter_result : dict
         Output of ``check_scatter()``.  Must have a ``"multiplier"`` key
         (int, bet-multiples: 0, 5, 15, or 50).
@@ -504,10 +1235,10 @@ def calculate_total_payout(
 
     Algorithm
     ---------
-    1. Each line win's ``payout_multiplier`` (float) is individually converted
-       to centibets via ``int(round(payout_multiplier × 100))``.  Rounding
-       per-win before summing minimises cumulative floating-point error while
-       keeping all addition in integer space.
+    1. Each line win contributes its integer ``payout_centibets``
+       (per-way pay in centibets × ways, from ``evaluate_ways_to_win()``;
+       a ``WinRecord`` built without it rounds ``payout_multiplier × 100``
+       once, at construction).
     2. The scatter multiplier is already an integer; centibets = multiplier × 100
        (pure integer multiplication, no floating-point involved).
     3. Both integer quantities are added with standard Python integer addition.
@@ -520,11 +1251,8 @@ def calculate_total_payout(
     the SDK's ``WinManager`` and ``update_final_win()`` in the simulation
     pipeline.
     """
-    # Step 1: convert each ways win to centibets individually, then sum integers
-    line_centibets: int = sum(
-        int(round(w["payout_multiplier"] * 100))
-        for w in line_wins
-    )
+    # Step 1: sum each ways win in centibets, already exact ints on WinRecord.
+    line_centibets: int = sum(w.payout_centibets for w in _as_win_records(line_wins))
 
     # Step 2: scatter multiplier is an integer; × 100 is integer multiplication
     scatter_centibets: int = scatter_result["multiplier"] * 100
@@ -621,7 +1349,7 @@ class GameCalculation(Executables):
         Overdrive meter.
 
         The scatter (S) pays a fixed multiple of TOTAL BET the moment 3+ land:
-        3 -> 1x, 4 -> 3x, 5 -> 10x (from ``GameConfig.scatter_multiplier_table``).
+        3 -> 1x, 4 -> 3x, 5 -> 10x (from ``GameConfig.scatter_mult_lut``).
         The award is multiplied by the current Overdrive meter
         (``self.global_multiplier``): 1x in the base game, and the current meter
         value during free spins.
@@ -637,19 +1365,18 @@ class GameCalculation(Executables):
         """
         scatter_count = self.count_special_symbols("scatter")
 
-        # 0-2 scatters pay nothing.
-        if scatter_count < min(self.config.scatter_multiplier_table.keys()):
+        # scatter_mult_lut is indexed by count: 0-2 scatters read 0.0 and pay
+        # nothing, and stacked free-spin counts above 5 already read the top
+        # (5-scatter) award. Plain floats, so nothing numpy reaches the books.
+        base_award = self.config.scatter_mult_lut[scatter_count]
+        if base_award == 0.0:
             return
 
         # If the win cap was already reached this spin, award nothing further.
         if self.wincap_triggered:
             return
 
-        # Free-spin draws are natural and scatters can stack, so counts above 5
-        # are possible; they pay the top (5-scatter) award. Instant award
-        # (bet-multiple) scaled by the current Overdrive meter.
-        award_count = min(scatter_count, max(self.config.scatter_multiplier_table.keys()))
-        base_award = self.config.scatter_multiplier_table[award_count]
+        # Instant award (bet-multiple) scaled by the current Overdrive meter.
         scatter_win = round(base_award * self.global_multiplier, 2)
 
         # positions come from special_syms_on_board (populated by draw_board).
@@ -689,7 +1416,7 @@ class GameCalculation(Executables):
 # Run directly:
 #   python game_executables/game_calculation.py
 #
-# No SDK imports required — only the four standalone functions are exercised.
+# No SDK imports required — only the standalone functions are exercised.
 # ═════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
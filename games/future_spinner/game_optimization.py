@@ -28,6 +28,25 @@ from optimization_program.optimization_config import (
     verify_optimization_input,
 )
 
+# Optimiser run settings shared by every mode; modes override only what
+# differs (mean-to-median band, test spins).
+_COMMON_PARAMS = {
+    "num_show": 5000,
+    "num_per_fence": 10000,
+    "min_m2m": 4,
+    "max_m2m": 8,
+    "pmb_rtp": 1.0,
+    "sim_trials": 5000,
+    "score_type": "rtp",
+}
+# Test-spin windows: short sessions for the paid-per-spin modes, fewer spins
+# weighted toward the first window for the buy modes.
+_BASE_TEST_SPINS = {"test_spins": [50, 100, 200], "test_weights": [0.3, 0.4, 0.3]}
+_BUY_TEST_SPINS = {"test_spins": [10, 20, 50], "test_weights": [0.6, 0.2, 0.2]}
+
+# Symbol search shared by every freegame fence.
+_SCATTER_SEARCH = {"symbol": "scatter"}
+
 
 class OptimizationSetup:
     """Game specific optimisation setup for the two-mode package."""
@@ -46,7 +65,7 @@ class OptimizationSetup:
                         rtp=0.0, av_win=0, search_conditions=0
                     ).return_dict(),
                     "freegame": ConstructConditions(
-                        rtp=0.38, hr=185, search_conditions={"symbol": "scatter"}
+                        rtp=0.38, hr=185, search_conditions=_SCATTER_SEARCH
                     ).return_dict(),
                     "basegame": ConstructConditions(rtp=0.5335, hr=3.5).return_dict(),
                 },
@@ -62,17 +81,7 @@ class OptimizationSetup:
                          "win_range": (1000, 4000), "probability": 1.0},
                     ]
                 ).return_dict(),
-                "parameters": ConstructParameters(
-                    num_show=5000,
-                    num_per_fence=10000,
-                    min_m2m=4,
-                    max_m2m=8,
-                    pmb_rtp=1.0,
-                    sim_trials=5000,
-                    test_spins=[50, 100, 200],
-                    test_weights=[0.3, 0.4, 0.3],
-                    score_type="rtp",
-                ).return_dict(),
+                "parameters": ConstructParameters(**_COMMON_PARAMS, **_BASE_TEST_SPINS).return_dict(),
                 "distribution_bias": ConstructFenceBias(
                     applied_criteria=["basegame"],
                     bias_ranges=[(1.0, 5.0)],
@@ -94,17 +103,7 @@ class OptimizationSetup:
                          "win_range": (1000, 4000), "probability": 1.0},
                     ]
                 ).return_dict(),
-                "parameters": ConstructParameters(
-                    num_show=5000,
-                    num_per_fence=10000,
-                    min_m2m=4,
-                    max_m2m=8,
-                    pmb_rtp=1.0,
-                    sim_trials=5000,
-                    test_spins=[10, 20, 50],
-                    test_weights=[0.6, 0.2, 0.2],
-                    score_type="rtp",
-                ).return_dict(),
+                "parameters": ConstructParameters(**_COMMON_PARAMS, **_BUY_TEST_SPINS).return_dict(),
             },
             "cruise": {
                 # Low-volatility (cost 1.0x, same 96.35% RTP as base): most of the
@@ -121,7 +120,7 @@ class OptimizationSetup:
                         rtp=0.0, av_win=0, search_conditions=0
                     ).return_dict(),
                     "freegame": ConstructConditions(
-                        rtp=0.18, hr=260, search_conditions={"symbol": "scatter"}
+                        rtp=0.18, hr=260, search_conditions=_SCATTER_SEARCH
                     ).return_dict(),
                     "basegame": ConstructConditions(rtp=0.7635, hr=2.3).return_dict(),
                 },
@@ -136,15 +135,7 @@ class OptimizationSetup:
                     ]
                 ).return_dict(),
                 "parameters": ConstructParameters(
-                    num_show=5000,
-                    num_per_fence=10000,
-                    min_m2m=2,
-                    max_m2m=4,
-                    pmb_rtp=1.0,
-                    sim_trials=5000,
-                    test_spins=[50, 100, 200],
-                    test_weights=[0.3, 0.4, 0.3],
-                    score_type="rtp",
+                    **{**_COMMON_PARAMS, "min_m2m": 2, "max_m2m": 4}, **_BASE_TEST_SPINS
                 ).return_dict(),
                 "distribution_bias": ConstructFenceBias(
                     applied_criteria=["basegame"],
@@ -161,7 +152,7 @@ class OptimizationSetup:
                     ).return_dict(),
                     "0": ConstructConditions(rtp=0.0, av_win=0, search_conditions=0).return_dict(),
                     "freegame": ConstructConditions(
-                        rtp=0.608, hr=115, search_conditions={"symbol": "scatter"}
+                        rtp=0.608, hr=115, search_conditions=_SCATTER_SEARCH
                     ).return_dict(),
                     "basegame": ConstructConditions(rtp=0.3055, hr=3.5).return_dict(),
                 },
@@ -173,11 +164,7 @@ class OptimizationSetup:
                          "win_range": (20, 80), "probability": 1.0},
                     ]
                 ).return_dict(),
-                "parameters": ConstructParameters(
-                    num_show=5000, num_per_fence=10000, min_m2m=4, max_m2m=8,
-                    pmb_rtp=1.0, sim_trials=5000, test_spins=[50, 100, 200],
-                    test_weights=[0.3, 0.4, 0.3], score_type="rtp",
-                ).return_dict(),
+                "parameters": ConstructParameters(**_COMMON_PARAMS, **_BASE_TEST_SPINS).return_dict(),
             },
             "super": {
                 # NITRO OVERDRIVE: 400x buy with the Overdrive meter pre-revved
@@ -197,9 +184,7 @@ class OptimizationSetup:
                       "win_range": (150, 800), "probability": 1.0}]
                 ).return_dict(),
                 "parameters": ConstructParameters(
-                    num_show=5000, num_per_fence=10000, min_m2m=4, max_m2m=12,
-                    pmb_rtp=1.0, sim_trials=5000, test_spins=[10, 20, 50],
-                    test_weights=[0.6, 0.2, 0.2], score_type="rtp",
+                    **{**_COMMON_PARAMS, "max_m2m": 12}, **_BUY_TEST_SPINS
                 ).return_dict(),
             },
         }
@@ -34,11 +34,29 @@ PRODUCTION = True
 from gamestate import GameState                                          # noqa: E402
 from game_config import GameConfig                                       # noqa: E402
 from game_optimization import OptimizationSetup                          # noqa: E402
-from optimization_program.run_script import OptimizationExecution        # noqa: E402
-from utils.game_analytics.run_analysis import create_stat_sheet          # noqa: E402
 from src.state.run_sims import create_books                              # noqa: E402
 from src.write_data.write_configs import generate_configs               # noqa: E402
 
+
+# -- Helpers -------------------------------------------------------------------
+def fit_threads(max_threads, num_sim_args, batching_size):
+    """Largest thread count <= max_threads and the CPUs available to us that
+    still splits every mode into whole batches.
+
+    run_multi_process_sims gives every (repeat, thread) pair
+    int(mode-sims / threads / repeats) sims, so a count that does not split
+    the mode evenly silently drops sims. create_books only asserts this when
+    mode-sims > batching_size ** 2, which the 100k-sim modes are not. Sim ids
+    are assigned in order across (repeat, thread), so any valid count writes
+    the same books - only the number of worker processes changes.
+    """
+    available = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    for threads in range(min(max_threads, available), 1, -1):
+        if all(ns % (threads * batching_size) == 0 for ns in num_sim_args.values()):
+            return threads
+    return 1
+
+
 # -- Entry point ---------------------------------------------------------------
 if __name__ == "__main__":
 
@@ -55,6 +73,8 @@ if __name__ == "__main__":
             "antelite": 100_000,
             "super":    100_000,
         }
+        # Never start more sim workers than CPUs (10 on the production host).
+        num_threads = fit_threads(num_threads, num_sim_args, batching_size)
         run_conditions = {
             "run_sims": True,
             "run_optimization": True,
@@ -118,10 +138,16 @@ if __name__ == "__main__":
 
     # 3. Optimisation for both modes -> weighted lookUpTable_*_0.csv
     if run_conditions["run_optimization"]:
+        # Imported here: run_script needs toml, only required when optimising.
+        from optimization_program.run_script import OptimizationExecution
+
         OptimizationExecution().run_all_modes(config, target_modes, rust_threads)
         generate_configs(gamestate)   # regenerate to refresh hashes
 
     # 4. Analytics -> statistics_summary.json + XLSX (both modes)
     if run_conditions["run_analysis"]:
         custom_keys = [{"symbol": "scatter"}]
+        # Imported here: the analytics writers pull in xlsxwriter.
+        from utils.game_analytics.run_analysis import create_stat_sheet
+
         create_stat_sheet(gamestate, custom_keys=custom_keys)
@@ -103,10 +103,11 @@ class ConstructConditions:
         none_count = sum([1 for x in [rtp, av_win, hr] if x is None])
         assert none_count <= 1, "Criteria RTP is ill defined."
 
-        search_range, force_search = (-1, -1), {}
+        # force_search stays None unless a symbol search is given, rather than
+        # allocating an empty dict per fence.
+        search_range, force_search = (-1, -1), None
         if isinstance(search_conditions, (float, int)):
             search_range = (search_conditions, search_conditions)
-            force_search = {}
         elif isinstance(search_conditions, tuple):
             assert search_conditions[0] <= search_conditions[1], "Enter (min, max) payout format."
             assert all(
@@ -114,7 +115,6 @@ class ConstructConditions:
             ), "Search condition (min,max) entries must be numbers."
             assert len(search_conditions) == 2, "Search condition length exceeded, enter (min, max) payout format."
             search_range = search_conditions
-            force_search = {}
         elif isinstance(search_conditions, dict):
             search_range = (-1, -1)
             force_search = search_conditions
@@ -27,34 +27,35 @@ class Board(GeneralGameState):
         reel_positions = [random.randrange(0, len(self.reelstrip[reel])) for reel in range(self.config.num_reels)]
         padding_positions = [0] * self.config.num_reels
         first_scatter_reel = -1
+        # Per-draw lookups hoisted out of the cell loop; the RNG calls above are
+        # unchanged, so boards are identical for a given seed.
+        create_symbol = self.create_symbol
+        include_padding = self.config.include_padding
+        num_rows = self.config.num_rows
         for reel in range(self.config.num_reels):
             reel_pos = reel_positions[reel]
-            if self.config.include_padding:
-                top_symbols.append(
-                    self.create_symbol(self.reelstrip[reel][(reel_pos - 1) % len(self.reelstrip[reel])])
-                )
-                bottom_symbols.append(
-                    self.create_symbol(
-                        self.reelstrip[reel][(reel_pos + len(board[reel])) % len(self.reelstrip[reel])]
-                    )
-                )
-            for row in range(self.config.num_rows[reel]):
-                sym_id = self.reelstrip[reel][(reel_pos + row) % len(self.reelstrip[reel])]
-                sym = self.create_symbol(sym_id)
-                board[reel][row] = sym
+            strip = self.reelstrip[reel]
+            strip_len = len(strip)
+            board_reel = board[reel]
+            if include_padding:
+                top_symbols.append(create_symbol(strip[(reel_pos - 1) % strip_len]))
+                bottom_symbols.append(create_symbol(strip[(reel_pos + len(board_reel)) % strip_len]))
+            for row in range(num_rows[reel]):
+                sym = create_symbol(strip[(reel_pos + row) % strip_len])
+                board_reel[row] = sym
                 if sym.defn.special:
                     for special_symbol in self.special_syms_on_board:
                         for s in self.config.special_symbols[special_symbol]:
-                            if board[reel][row].name == s:
+                            if sym.name == s:
                                 self.special_syms_on_board[special_symbol] += [{"reel": reel, "row": row}]
                                 if (
-                                    board[reel][row].check_attribute("scatter")
+                                    sym.check_attribute("scatter")
                                     and len(self.special_syms_on_board[special_symbol])
                                     >= self.config.anticipation_triggers[self.gametype]
                                     and first_scatter_reel == -1
                                 ):
                                     first_scatter_reel = reel + 1
-            padding_positions[reel] = (reel_positions[reel] + len(board[reel]) + 1) % len(self.reelstrip[reel])
+            padding_positions[reel] = (reel_pos + len(board_reel) + 1) % strip_len
 
         if first_scatter_reel > -1 and first_scatter_reel != self.config.num_reels:
             count = 1
@@ -6,6 +6,16 @@ from copy import deepcopy
 class Book:
     "Stores simulation information."
 
+    # One Book is created per simulation (and per repeat); slots keep it small.
+    __slots__ = (
+        "id",
+        "payout_multiplier",
+        "events",
+        "criteria",
+        "basegame_wins",
+        "freegame_wins",
+    )
+
     def __init__(self, book_id: int, criteria: str):
         "Initialize simulation book"
         self.id = book_id
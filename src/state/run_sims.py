@@ -1,8 +1,9 @@
+import sys
 import time
 import math
 import random
 import hashlib
-from multiprocessing import Process, Manager
+from multiprocessing import get_context
 import cProfile
 from warnings import warn
 import shutil
@@ -11,6 +12,12 @@ from typing import Dict
 
 from src.write_data.write_data import output_lookup_and_force_files
 
+# On Linux sim workers are forked so they inherit the prebuilt gamestate
+# copy-on-write rather than pickling it per process. Pinned explicitly because
+# Python 3.14 no longer defaults to fork there. Other platforms keep their
+# default (spawn on macOS, where fork is unsafe, and on Windows).
+_MP_CONTEXT = get_context("fork") if sys.platform.startswith("linux") else get_context()
+
 
 def create_books(
     gamestate: object,
@@ -205,67 +212,69 @@ def run_multi_process_sims(
             criteria_counter[c] += 1
             simulation_seeds.append(offset_val)
 
-    for repeat in range(num_repeats):
-        print("Batch", repeat + 1, "of", num_repeats)
-        processes = []
-        manager = Manager()
-        all_betmode_configs = manager.list()
-        if profiling:
-            asyncio.run(
-                profile_and_visualize(
-                    game_id=game_id,
-                    gamestate=gamestate,
-                    all_betmode_configs=all_betmode_configs,
+    # One manager server for the whole mode rather than one per batch; each
+    # batch still gets a fresh shared list. Exiting the block shuts it down
+    # on every path, including threads == 1 and profiling.
+    with _MP_CONTEXT.Manager() as manager:
+        for repeat in range(num_repeats):
+            print("Batch", repeat + 1, "of", num_repeats)
+            processes = []
+            all_betmode_configs = manager.list()
+            if profiling:
+                asyncio.run(
+                    profile_and_visualize(
+                        game_id=game_id,
+                        gamestate=gamestate,
+                        all_betmode_configs=all_betmode_configs,
+                        betmode=betmode,
+                        sim_allocation=criteria_assignment,
+                        threads=threads,
+                        num_repeats=num_repeats,
+                        sims_per_thread=sims_per_thread,
+                        repeat=repeat,
+                        compress=compress,
+                        write_event_list=write_event_list,
+                        simulation_seeds=simulation_seeds,
+                    )
+                )
+            elif threads == 1:
+                gamestate.run_sims(
+                    betmode_copy_list=all_betmode_configs,
                     betmode=betmode,
-                    sim_allocation=criteria_assignment,
-                    threads=threads,
-                    num_repeats=num_repeats,
-                    sims_per_thread=sims_per_thread,
-                    repeat=repeat,
+                    sim_to_criteria=criteria_assignment,
+                    total_threads=threads,
+                    total_repeats=num_repeats,
+                    num_sims=sims_per_thread,
+                    thread_index=0,
+                    repeat_count=repeat,
                     compress=compress,
                     write_event_list=write_event_list,
                     simulation_seeds=simulation_seeds,
                 )
-            )
-        elif threads == 1:
-            gamestate.run_sims(
-                betmode_copy_list=all_betmode_configs,
-                betmode=betmode,
-                sim_to_criteria=criteria_assignment,
-                total_threads=threads,
-                total_repeats=num_repeats,
-                num_sims=sims_per_thread,
-                thread_index=0,
-                repeat_count=repeat,
-                compress=compress,
-                write_event_list=write_event_list,
-                simulation_seeds=simulation_seeds,
-            )
-        else:
-            for thread in range(threads):
-                process = Process(
-                    target=gamestate.run_sims,
-                    args=(
-                        all_betmode_configs,
-                        betmode,
-                        criteria_assignment,
-                        threads,
-                        num_repeats,
-                        sims_per_thread,
-                        thread,
-                        repeat,
-                        compress,
-                        write_event_list,
-                        simulation_seeds,
-                    ),
-                )
-                print("Started thread", thread)
-                process.start()
-                processes += [process]
-            print("All threads are online.")
-            for process in processes:
-                process.join()
-            print("Finished joining threads.")
-            gamestate.combine(all_betmode_configs, betmode)
-            gamestate.get_betmode(betmode).lock_force_keys()
-            manager.shutdown()
+            else:
+                for thread in range(threads):
+                    process = _MP_CONTEXT.Process(
+                        target=gamestate.run_sims,
+                        args=(
+                            all_betmode_configs,
+                            betmode,
+                            criteria_assignment,
+                            threads,
+                            num_repeats,
+                            sims_per_thread,
+                            thread,
+                            repeat,
+                            compress,
+                            write_event_list,
+                            simulation_seeds,
+                        ),
+                    )
+                    print("Started thread", thread)
+                    process.start()
+                    processes += [process]
+                print("All threads are online.")
+                for process in processes:
+                    process.join()
+                print("Finished joining threads.")
+                gamestate.combine(all_betmode_configs, betmode)
+                gamestate.get_betmode(betmode).lock_force_keys()
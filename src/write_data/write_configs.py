@@ -124,7 +124,7 @@ def make_temp_math_config(gamestate):
 
                 fence_info["identity_condition"] = {}
                 fence_info["identity_condition"]["search"] = []
-                if fence_obj["force_search"] != {}:
+                if fence_obj["force_search"]:
                     for search_key, search_val in fence_obj["force_search"].items():
                         fence_info["identity_condition"]["search"].append(
                             {
@@ -191,7 +191,7 @@ def make_math_config(gamestate):
             search_data = []
             for cond, opt_obj in mode_obj["conditions"].items():
                 opt_dict = opt_obj.to_dict()
-                if opt_dict["force_search"] != {}:
+                if opt_dict["force_search"]:
                     search_data.append({})
                     search_data[-1]["name"] = str(list(opt_dict["force_search"].keys())[0])
                     search_data[-1]["value"] = str(list(opt_dict["force_search"].values())[0])
@@ -144,18 +144,27 @@ def output_lookup_and_force_files(
             )
 
     if compress:
-        temp_book_output_path = os.path.join(gamestate.output_files.book_path, "temp_book_output.json")
-        with open(temp_book_output_path, "w", encoding="UTF-8") as outfile:
-            for fname in file_list:
-                with open(fname, "rb") as infile:
-                    decompressed = zstd.ZstdDecompressor().decompress(infile.read())
-                    outfile.write(decompressed.decode("UTF-8"))
+        # Batches are decompressed straight into one buffer sized from their
+        # frame headers and compressed in one call: a single copy of the books
+        # in memory, with no UTF-8 round trip or temporary text file.
+        sizes = []
+        for fname in file_list:
+            with open(fname, "rb") as infile:
+                # 18 bytes is the largest zstd frame header.
+                sizes.append(zstd.get_frame_parameters(infile.read(18)).content_size)
+        assert all(size >= 0 for size in sizes), "Temporary book frames must record their content size."
+
+        decompressor = zstd.ZstdDecompressor()
+        books = bytearray(sum(sizes))
+        offset = 0
+        for fname, size in zip(file_list, sizes):
+            with open(fname, "rb") as infile:
+                books[offset:offset + size] = decompressor.decompress(infile.read())
+            offset += size
 
         final_out = gamestate.output_files.get_final_book_name(betmode, True)
-        with open(temp_book_output_path, "rb") as f_in, open(final_out, "wb") as f_out:
-            f_out.write(zstd.ZstdCompressor().compress(f_in.read()))
-
-        os.remove(temp_book_output_path)
+        with open(final_out, "wb") as f_out:
+            f_out.write(zstd.ZstdCompressor().compress(books))
     else:
         with open(
             gamestate.output_files.get_final_book_name(betmode, False),
@@ -0,0 +1,247 @@
+"""Test Future Spinner standalone win calculations."""
+
+import json
+import random
+
+import numpy as np
+import pytest
+from games.future_spinner.game_config import GameConfig
+from games.future_spinner.game_executables.game_calculation import (
+    board_names,
+    boards_from_stops,
+    build_events,
+    calculate_total_payout,
+    check_scatter,
+    check_scatter_packed,
+    collect_wins,
+    count_symbol,
+    evaluate_ways_to_win,
+    evaluate_ways_to_win_batch,
+    make_ways_evaluator_ids,
+    pack_board,
+    sample_stops,
+    simulate_base_batch,
+    simulate_base_parallel,
+)
+
+# Self-test board of game_calculation.py: 4 H1, 1 W, 3 S.
+TEST_BOARD = [
+    ["H1", "S", "L2", "L1"],
+    ["H1", "W", "S", "M2"],
+    ["H1", "M3", "S", "L2"],
+    ["L3", "M1", "H2", "L1"],
+    ["L2", "M2", "H1", "L3"],
+]
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Game config; the tests only read its symbol and pay tables."""
+    return GameConfig()
+
+
+def write_strip_csv(path, strip):
+    """Write a [reel][stop] symbol-name strip as a reel CSV, one stop per line."""
+    path.write_text("".join(",".join(stop) + "\n" for stop in zip(*strip)), encoding="UTF-8")
+    return str(path)
+
+
+@pytest.fixture
+def strip_csv(config, tmp_path):
+    """Reel CSV of a random 5 x 60 strip, with every symbol on every reel."""
+    rng = random.Random(0)
+    strip = [list(config.id_to_symbol) * 2 + rng.choices(config.id_to_symbol, k=40) for _ in range(5)]
+    return write_strip_csv(tmp_path / "TEST.csv", strip)
+
+
+@pytest.fixture
+def sim_config(config, strip_csv, monkeypatch):
+    """Game config with strip "TEST" loaded from strip_csv, removed again after the test."""
+    strip_ids = config.strip_to_ids(config.read_reels_csv(strip_csv))
+    monkeypatch.setitem(config.reel_ids, "TEST", strip_ids)
+    monkeypatch.setitem(config.reel_symbol_counts, "TEST", config.strip_symbol_counts(strip_ids))
+    return config
+
+
+def scalar_wins(config, board):
+    """evaluate_ways_to_win() wins as sorted (symbol_id, kind, centibets)."""
+    return sorted(
+        (config.symbol_to_id[w.symbol], w.count, w.payout_centibets)
+        for w in evaluate_ways_to_win(board, config.paytable)
+    )
+
+
+def to_ids(config, board):
+    """Symbol-name board to nested lists of symbol ids."""
+    return [[config.symbol_to_id[sym] for sym in reel] for reel in board]
+
+
+def random_boards(config, num_boards, seed=0):
+    """Random 5x4 symbol-name boards, Wilds and Scatters included."""
+    rng = random.Random(seed)
+    return [
+        [[rng.choice(config.id_to_symbol) for _ in range(4)] for _ in range(5)]
+        for _ in range(num_boards)
+    ]
+
+
+def test_ways_evaluator_ids_matches_function(config):
+    evaluate = make_ways_evaluator_ids(config.paytable_int, config.wild_ids)
+    for board in random_boards(config, 2000):
+        assert evaluate(to_ids(config, board)) == scalar_wins(config, board)
+
+
+def test_count_symbol(config):
+    packed = pack_board(to_ids(config, TEST_BOARD))
+    assert count_symbol(packed, config.scatter_id) == 3
+    assert count_symbol(packed, config.symbol_to_id["H1"]) == 4
+    assert count_symbol(packed, config.wild_id) == 1
+    for board in random_boards(config, 500):
+        packed = pack_board(to_ids(config, board))
+        for sym_id, sym in enumerate(config.id_to_symbol):
+            assert count_symbol(packed, sym_id) == sum(reel.count(sym) for reel in board)
+
+
+def test_check_scatter_packed_matches_check_scatter(config):
+    for board in random_boards(config, 2000):
+        assert check_scatter_packed(pack_board(to_ids(config, board)), config.scatter_id) == check_scatter(board)
+
+
+def test_events_take_plain_win_dicts(config):
+    for board in random_boards(config, 500):
+        wins = evaluate_ways_to_win(board, config.paytable)
+        scatter = check_scatter(board)
+        total = calculate_total_payout(wins, scatter)
+        events = build_events(board, wins, scatter, total / 100)
+        for win_dicts in (
+            [w.to_dict() for w in wins],
+            # Dicts from before payout_centibets existed.
+            [{k: v for k, v in w.to_dict().items() if k != "payout_centibets"} for w in wins],
+        ):
+            assert calculate_total_payout(win_dicts, scatter) == total
+            assert build_events(board, win_dicts, scatter, total / 100) == events
+
+
+def test_compiled_sim_tables_match_get_sim_tables(sim_config, tmp_path):
+    path = tmp_path / "tables.npz"
+    sim_config.dump_compiled(str(path))
+    compiled = GameConfig.compiled_sim_tables(GameConfig.load_compiled(str(path)), "TEST")
+    tables = sim_config.get_sim_tables("TEST")
+    assert compiled.keys() == tables.keys()
+    for key, value in tables.items():
+        assert np.array_equal(compiled[key], value), key
+
+    totals = simulate_base_batch(compiled, 1000, np.random.default_rng(1))
+    assert np.array_equal(totals, simulate_base_batch(tables, 1000, np.random.default_rng(1)))
+
+
+def test_batch_matches_function(config):
+    boards = random_boards(config, 2000)
+    spin_idx, symbol_id, kind, centibets = evaluate_ways_to_win_batch(
+        np.array([to_ids(config, board) for board in boards]), config.paytable_int, config.wild_ids
+    )
+    batch_wins = [[] for _ in boards]
+    for spin, win in zip(spin_idx.tolist(), zip(symbol_id.tolist(), kind.tolist(), centibets.tolist())):
+        batch_wins[spin].append(win)
+    for board, wins in zip(boards, batch_wins):
+        assert wins == scalar_wins(config, board)
+
+
+def test_batch_empty(config):
+    empty = np.zeros((0, 5, 4), dtype=np.int8)
+    assert all(a.size == 0 for a in evaluate_ways_to_win_batch(empty, config.paytable_int, config.wild_ids))
+
+
+def test_collect_wins_matches_function(config):
+    boards = random_boards(config, 2000)
+    wins = collect_wins(np.array([to_ids(config, board) for board in boards]), config.paytable_int, config.wild_ids)
+    expected = []
+    for spin, board in enumerate(boards):
+        for w in sorted(evaluate_ways_to_win(board, config.paytable), key=lambda w: config.symbol_to_id[w.symbol]):
+            pos = sum(1 << ((code >> 4) * 4 + (code & 0xF)) for code in w.packed_positions)
+            expected.append((spin, config.symbol_to_id[w.symbol], w.count, w.payout_centibets, pos))
+    assert [tuple(int(v) for v in record) for record in wins] == expected
+
+    totals = np.bincount(wins.spin, weights=wins.cb, minlength=len(boards))
+    no_scatter = {"multiplier": 0}
+    assert totals.tolist() == [
+        calculate_total_payout(evaluate_ways_to_win(board, config.paytable), no_scatter) for board in boards
+    ]
+
+
+def test_simulate_base_batch_matches_scalar(sim_config):
+    tables = sim_config.get_sim_tables("TEST")
+    totals = simulate_base_batch(tables, 2000, np.random.default_rng(7))
+
+    # Same stops as the batch draws, evaluated one board at a time.
+    stops = sample_stops(tables["reels"], 2000, np.random.default_rng(7))
+    for total, board_ids in zip(totals.tolist(), boards_from_stops(tables["reels"], stops)):
+        board = board_names(board_ids, sim_config.id_to_symbol)
+        ways = calculate_total_payout(evaluate_ways_to_win(board, sim_config.paytable), {"multiplier": 0})
+        scatter_count = check_scatter(board)["count"]
+        assert total == ways + int(tables["scatter_mult_int"][scatter_count])
+
+
+def test_simulate_base_parallel_matches_batch(sim_config):
+    tables = sim_config.get_sim_tables("TEST")
+    totals = simulate_base_parallel(tables, 1001, num_workers=2, seed=3, batch_size=200)
+    assert totals.shape == (1001,)
+
+    # Worker i draws its share from the i-th spawned stream, in batches.
+    expected = []
+    for seed, share in zip(np.random.SeedSequence(3).spawn(2), (501, 500)):
+        rng = np.random.default_rng(seed)
+        for start in range(0, share, 200):
+            expected.append(simulate_base_batch(tables, min(200, share - start), rng))
+    assert np.array_equal(totals, np.concatenate(expected))
+
+
+def test_win_positions_are_not_shared(config):
+    board = [["H1"] * 4] * 3 + [["L1"] * 4] * 2
+    first = evaluate_ways_to_win(board, config.paytable)[0]
+    first.positions[0]["row"] = 3
+    first.to_dict()["positions"][0]["row"] = 3
+    assert first.positions[0] == {"reel": 0, "row": 0}
+    assert evaluate_ways_to_win(board, config.paytable)[0].positions[0] == {"reel": 0, "row": 0}
+
+
+def test_reveal_cells_are_not_shared():
+    board = [["H1"] * 4] * 5
+    events = build_events(board, [], {"multiplier": 0}, 0.0)
+    events[0]["board"][0][0]["name"] = "L3"
+    assert build_events(board, [], {"multiplier": 0}, 0.0)[0]["board"][0][0] == {"name": "H1"}
+    assert events[0]["board"][0][1] == {"name": "H1"}
+
+
+def test_win_record_reads_like_a_dict(config):
+    win = evaluate_ways_to_win(TEST_BOARD, config.paytable)[0]
+    expected = win.to_dict()
+    assert "symbol" in win and "kind" not in win
+    assert list(win.keys()) == list(expected)
+    assert len(win) == len(expected)
+    assert dict(win) == expected
+    assert win == expected
+    assert win.get("count") == expected["count"] and win.get("kind") is None
+    assert json.loads(json.dumps(win.to_dict())) == expected
+
+
+def test_sample_stops(sim_config):
+    reels = sim_config.reel_ids["TEST"]
+    stops = sample_stops(reels, 60_000, np.random.default_rng(5))
+    assert stops.shape == (60_000, 5)
+    assert stops.min() == 0 and stops.max() == reels.shape[1] - 1
+    # Uniform: every stop of every reel lands about 1000 times.
+    hits = np.stack([np.bincount(reel_stops, minlength=reels.shape[1]) for reel_stops in stops.T])
+    assert 800 < hits.min() and hits.max() < 1200
+    assert np.array_equal(stops, sample_stops(reels, 60_000, np.random.default_rng(5)))
+
+
+def test_strip_tables_match_csv(config, strip_csv):
+    strip = config.read_reels_csv(strip_csv)
+    strip_ids = config.strip_to_ids(strip)
+    assert strip_ids.dtype == np.int8 and strip_ids.shape == (5, 60)
+    assert [[config.id_to_symbol[sym_id] for sym_id in reel] for reel in strip_ids.tolist()] == strip
+
+    counts = config.strip_symbol_counts(strip_ids)
+    assert counts.dtype == np.int32
+    assert counts.tolist() == [[reel.count(sym) for sym in config.id_to_symbol] for reel in strip]
@@ -10,16 +10,20 @@ def get_lookup_length(filepath: str) -> int:
 
 def make_win_distribution(filepath: str, normalize: bool = True) -> dict:
     """Construct win-distribution with unique, ordered payouts."""
-    dist = defaultdict(float)
-    with open(filepath, "r", encoding="UTF-8") as f:
-        for line in f:
-            _, weight, payout = line.strip().split(",")
-            weight = int(weight)
-            payout = float(payout) / 100
-            dist[payout] += weight
-
-    # Sort by win amount
-    dist = dict(sorted(dist.items(), key=lambda x: x[0], reverse=False))
+    # Parsed in C by loadtxt; bincount sums each payout's weights in file
+    # order, so the result matches a line-by-line accumulation exactly.
+    table = np.loadtxt(
+        filepath,
+        delimiter=",",
+        usecols=(1, 2),
+        ndmin=1,
+        dtype=[("weight", np.uint64), ("payout", np.float64)],
+    )
+    payouts, inverse = np.unique(table["payout"] / 100, return_inverse=True)
+    weights = np.bincount(inverse, weights=table["weight"].astype(np.float64), minlength=len(payouts))
+
+    # Sorted by win amount (np.unique)
+    dist = dict(zip(payouts.tolist(), weights.tolist()))
     if normalize:
         total_weight = sum(dist.values())
         dist = {x: y / total_weight for x, y in dist.items()}
@@ -32,9 +32,10 @@ class HitRateCalculations:
         payouts = []
         with open(lut_file, "r", encoding="UTF-8") as f:
             for line in f:
-                lut_ids.append(int(line.strip().split(",")[0]))
-                weights.append(int(line.strip().split(",")[1]))
-                payouts.append(float(line.strip().split(",")[2]))
+                lut_id, weight, payout = line.strip().split(",")
+                lut_ids.append(int(lut_id))
+                weights.append(int(weight))
+                payouts.append(float(payout))
         f.close()
 
         self.weights = weights